@@ -2,31 +2,63 @@
 #  Imports
 # ==============================================================================
 import os
+import asyncio
 import logging
-import requests
+import atexit
+import httpx
+import orjson
 import csv
-import json
 import sqlite3
-from datetime import datetime, timedelta
+import queue
+import zlib
+import time
+import re
+import hashlib
+from datetime import datetime
 from pathlib import Path
-from contextlib import contextmanager
-from fastapi import FastAPI, HTTPException
+from urllib.parse import urlencode
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import contextmanager, asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
+from itertools import islice
+from fastapi import FastAPI, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, field_validator, ValidationError, ConfigDict
-from typing import Dict, List, Any, Optional
-from dotenv import load_dotenv
-from cachetools import cached, TTLCache
+from fastapi.responses import ORJSONResponse, StreamingResponse, Response
+from pydantic import BaseModel, Field, field_validator, ValidationError, ConfigDict, TypeAdapter
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable
+from cachetools import TTLCache
 
 # ==============================================================================
 #  Configuration & Initial Setup
 # ==============================================================================
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Log records are queued and written to stderr by a listener thread, so a
+# slow log pipe never blocks the event loop
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(_log_queue, _log_output)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flushes queued records on exit
+_log_enqueue = QueueHandler(_log_queue)
+_log_enqueue.setFormatter(logging.Formatter('%(message)s'))  # The listener adds the prefix
+logging.basicConfig(level=logging.INFO, handlers=[_log_enqueue])
 logger = logging.getLogger(__name__)
+# httpx logs every request URL at INFO, which would put the API key in the logs
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# .env files are a local development convenience; deployed containers get their
+# environment from the platform (FASTAPI_ENV=production), so they skip the
+# file lookup and the python-dotenv import
+LOAD_DOTENV = os.getenv("FASTAPI_ENV", "development") == "development"
 
 # LOAD API KEY FROM ENVIRONMENT VARIABLES (Render) OR .ENV FILE (Local)
 def load_environment():
-    """Load environment variables from .env file or system environment"""
-    load_dotenv(override=False)  # Don't override system env vars (for Render)
+    """Load environment variables from .env file (development) or system environment"""
+    if LOAD_DOTENV:
+        from dotenv import load_dotenv
+        load_dotenv(override=False)  # Don't override system env vars (for Render)
     return os.getenv("ALPHA_VANTAGE_API_KEY")
 
 ALPHA_VANTAGE_API_KEY = load_environment()
@@ -36,288 +68,542 @@ if ALPHA_VANTAGE_API_KEY == "demo":
     logger.warning("Using demo API key - functionality will be limited")
 
 ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
+# Compact payloads are tens of KB; anything past this is not a response we want in memory
+MAX_UPSTREAM_RESPONSE_BYTES = 5 * 1024 * 1024
+# Cap on simultaneous Alpha Vantage requests; a burst of distinct tickers queues
+# here instead of opening a socket each and burning through the rate limit at once
+MAX_CONCURRENT_UPSTREAM_REQUESTS = 16
+
+# Tickers whose overviews are loaded at startup, e.g. PREFETCH_TICKERS="TEL,ST,DD,CE,LYB"
+# for the dashboard's default table. Off by default: every worker prefetches on its own
+PREFETCH_TICKERS = tuple(
+    ticker.strip().upper() for ticker in os.getenv("PREFETCH_TICKERS", "").split(",") if ticker.strip()
+)
+
+# Shared async HTTP client and its concurrency cap, created and closed by the app lifespan
+http_client: Optional[httpx.AsyncClient] = None
+upstream_slots: Optional[asyncio.Semaphore] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared Alpha Vantage client on startup and close it on shutdown."""
+    global http_client, upstream_slots
+    # asyncio.to_thread only carries SQLite cache I/O; sizing its executor to
+    # the connection pool means every worker thread reuses a pooled connection
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=SQLITE_POOL_SIZE, thread_name_prefix="cache-io")
+    )
+    # Keep TLS sessions alive between misses and multiplex them over HTTP/2. One
+    # HTTP/2 connection carries every concurrent request, so only a few sockets
+    # are kept idle; the connection cap matches the upstream semaphore in case
+    # the CDN ever answers over HTTP/1.1
+    http_client = httpx.AsyncClient(
+        # An unreachable upstream fails fast; slow responses still get 10s
+        timeout=httpx.Timeout(10.0, connect=2.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=4,
+            max_connections=MAX_CONCURRENT_UPSTREAM_REQUESTS,
+            keepalive_expiry=300,
+        ),
+        http2=True,
+    )
+    upstream_slots = asyncio.Semaphore(MAX_CONCURRENT_UPSTREAM_REQUESTS)
+    if PREFETCH_TICKERS:
+        # Warm the caches without holding up startup
+        task = asyncio.create_task(prefetch_overviews(PREFETCH_TICKERS))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    try:
+        yield
+    finally:
+        # Refreshes and prefetches only improve freshness, so drop them, but
+        # wait for them to unwind so their fetch leases are released before
+        # the pool closes; let their writes land
+        for task in _background_tasks:
+            task.cancel()
+        if _background_tasks:
+            await asyncio.gather(*_background_tasks, return_exceptions=True)
+        # Let in-flight cache writes land before the process goes away
+        if _pending_writes:
+            await asyncio.gather(*_pending_writes, return_exceptions=True)
+        await http_client.aclose()
+        http_client = None
+        close_sqlite_pool()
 
 app = FastAPI(
     title="WindBorne Vendor API",
     description="An API to fetch and analyze financial data for potential vendors.",
     version="1.1.0", # Version bump for new features
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# A single cache for all our endpoints
-cache = TTLCache(maxsize=200, ttl=3600) # Increased size for more endpoints
+# One in-memory cache per Alpha Vantage function, since freshness needs differ:
+# prices move intraday, fundamentals daily, and symbol search results almost never
+caches: Dict[str, TTLCache] = {
+    "OVERVIEW": TTLCache(maxsize=200, ttl=6 * 3600),
+    "INCOME_STATEMENT": TTLCache(maxsize=200, ttl=24 * 3600),
+    "TIME_SERIES_DAILY": TTLCache(maxsize=500, ttl=15 * 60),
+    "SYMBOL_SEARCH": TTLCache(maxsize=500, ttl=7 * 24 * 3600),
+}
+default_cache = TTLCache(maxsize=200, ttl=3600)
+
+# How long fetched data stays fresh, per function. This one table sets the
+# SQLite row's expires_at and the freshness reported to clients; the memory
+# TTLs above only bound how long a worker goes before re-reading SQLite
+DATA_TTL_SECONDS: Dict[str, int] = {
+    "OVERVIEW": 7 * 24 * 3600,          # Fundamentals change quarterly
+    "INCOME_STATEMENT": 7 * 24 * 3600,  # Annual reports
+    "TIME_SERIES_DAILY": 15 * 60,       # The latest close moves intraday
+    "SYMBOL_SEARCH": 7 * 24 * 3600,
+}
+DEFAULT_DATA_TTL_SECONDS = 3600
+
+# Epoch at which each memory-cached payload stops being fresh upstream data, as
+# (payload, expires_at) by params; a stale SQLite row stays in memory past its
+# expiry while it is refreshed, so the memory TTL alone doesn't say this
+payload_expiry: TTLCache = TTLCache(
+    maxsize=sum(c.maxsize for c in caches.values()) + default_cache.maxsize,
+    ttl=max(c.ttl for c in caches.values()),
+)
+
+# Final, serialized /overview responses by ticker as (payload they were built
+# from, body, ETag, epoch fresh until); a hit skips projection and JSON encoding entirely
+OVERVIEW_RESPONSE_TTL = 6 * 3600
+overview_responses: TTLCache = TTLCache(maxsize=200, ttl=OVERVIEW_RESPONSE_TTL)
+
+# How long browsers and CDNs may keep serving an overview past its max-age
+# while they revalidate it; fundamentals only change quarterly
+OVERVIEW_STALE_WHILE_REVALIDATE = 3600
+
+# Hashable key for a set of Alpha Vantage query params, e.g. (("function", "OVERVIEW"), ("symbol", "CE"))
+ParamsKey = Tuple[Tuple[str, str], ...]
+
+# Called by whichever caller fetched a payload, with the payload, the raw body
+# and the epoch it stays fresh until
+OnFetch = Callable[[dict, bytes, int], None]
+
+def _key(**params: str) -> ParamsKey:
+    """Build a cache key from query params; a sorted tuple hashes faster than a frozenset."""
+    return tuple(sorted(params.items()))
+
+# Letters, digits, dots and dashes, e.g. "CE", "BRK.B", "BF-A"
+TICKER_PATTERN = re.compile(r"[A-Za-z0-9.\-]{1,10}")
+
+# Dashboard traffic hits the same handful of tickers over and over, so memoize
+# the validated, uppercased ticker instead of rebuilding it on every request.
+# Rejected input raises, and lru_cache never stores a raised call
+@lru_cache(maxsize=1024)
+def normalize_ticker(ticker: str) -> str:
+    """Validate a ticker from the request path and return it uppercased."""
+    if not TICKER_PATTERN.fullmatch(ticker):
+        raise HTTPException(status_code=422, detail=f"Invalid ticker symbol '{ticker}'.")
+    return ticker.upper()
+
+# The params helpers take a normalized ticker
+@lru_cache(maxsize=512)
+def overview_params(ticker: str) -> ParamsKey:
+    return _key(function="OVERVIEW", symbol=ticker)
+
+@lru_cache(maxsize=512)
+def income_params(ticker: str) -> ParamsKey:
+    return _key(function="INCOME_STATEMENT", symbol=ticker)
+
+@lru_cache(maxsize=512)
+def daily_params(ticker: str) -> ParamsKey:
+    return _key(function="TIME_SERIES_DAILY", symbol=ticker, outputsize="compact")
+
+# Upstream requests currently in flight, keyed like the cache
+_inflight: Dict[ParamsKey, asyncio.Future] = {}
+# Full memory -> SQLite -> upstream loads currently in flight, keyed the same way
+_loading: Dict[ParamsKey, asyncio.Future] = {}
+
+# Fire-and-forget cache writes; held here so they aren't garbage collected mid-write
+_pending_writes: set = set()
+# Background refetches of stale SQLite rows and the startup prefetch, held for the same reason
+_background_tasks: set = set()
+
+# Keys refreshed recently; a stale payload keeps being served while its refresh
+# fails (usually the rate limit), and this spaces out the retries
+STALE_REFRESH_RETRY_SECONDS = 300
+_recent_refreshes: TTLCache = TTLCache(maxsize=1000, ttl=STALE_REFRESH_RETRY_SECONDS)
 
 # ==============================================================================
-#  CSV Caching System
+#  SQLite Caching System
 # ==============================================================================
-CSV_CACHE_DIR = Path("csv_cache")
-CSV_CACHE_DIR.mkdir(exist_ok=True)
-
-# Cache expiry time (7 days)
-CACHE_EXPIRY_DAYS = 7
+SQLITE_DB_PATH = Path("cache.db")
 
-def get_csv_cache_path(data_type: str, symbol: str) -> Path:
-    """Generate CSV cache file path for given data type and symbol."""
-    return CSV_CACHE_DIR / f"{data_type}_{symbol.upper()}.csv"
+SECONDS_PER_DAY = 24 * 60 * 60
 
-def is_cache_valid(file_path: Path) -> bool:
-    """Check if CSV cache file exists and is not expired."""
-    if not file_path.exists():
-        return False
+# Bump whenever a table definition or stored payload format changes
+SQLITE_SCHEMA_VERSION = 5
+SQLITE_TABLES = ("cache", "overview_data", "income_statements", "daily_series", "fetch_leases")
 
-    file_age = datetime.now() - datetime.fromtimestamp(file_path.stat().st_mtime)
-    return file_age < timedelta(days=CACHE_EXPIRY_DAYS)
+# Cached payloads are zlib-compressed JSON; the repeated Alpha Vantage keys
+# compress very well and smaller rows keep more of the cache in the page cache
+PAYLOAD_COMPRESSION_LEVEL = 6
 
-def save_to_csv_cache(data_type: str, symbol: str, data: Dict[str, Any]) -> None:
-    """Save API response data to CSV cache."""
-    file_path = get_csv_cache_path(data_type, symbol)
+# timestamp/expires_at are stored as integer unix epochs, which compare and
+# index more cheaply than ISO-8601 text; expires_at comes from DATA_TTL_SECONDS
 
-    try:
-        if data_type == "overview":
-            # Save overview data
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['timestamp', 'symbol', 'name', 'market_cap', 'pe_ratio', 'ebitda', 'raw_data']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerow({
-                    'timestamp': datetime.now().isoformat(),
-                    'symbol': data.get('Symbol', ''),
-                    'name': data.get('Name', ''),
-                    'market_cap': data.get('MarketCapitalization', ''),
-                    'pe_ratio': data.get('PERatio', ''),
-                    'ebitda': data.get('EBITDA', ''),
-                    'raw_data': json.dumps(data)
-                })
-
-        elif data_type == "income_statement":
-            # Save income statement data
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['timestamp', 'symbol', 'annual_reports_data', 'raw_data']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerow({
-                    'timestamp': datetime.now().isoformat(),
-                    'symbol': data.get('symbol', symbol),
-                    'annual_reports_data': json.dumps(data.get('annualReports', [])),
-                    'raw_data': json.dumps(data)
-                })
-
-        elif data_type == "daily_series":
-            # Save daily series data
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['timestamp', 'symbol', 'time_series_data', 'raw_data']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                time_series = data.get('Time Series (Daily)', {})
-                writer.writerow({
-                    'timestamp': datetime.now().isoformat(),
-                    'symbol': data.get('Meta Data', {}).get('2. Symbol', symbol),
-                    'time_series_data': json.dumps(time_series),
-                    'raw_data': json.dumps(data)
-                })
-
-        logger.info(f"Saved {data_type} data for {symbol} to CSV cache: {file_path}")
+# How long past expiry a row may still be served while a background refresh
+# replaces it; rows older than that are treated as a plain miss
+CACHE_STALE_GRACE_SECONDS = 7 * SECONDS_PER_DAY
 
-    except Exception as e:
-        logger.error(f"Failed to save {data_type} data for {symbol} to CSV cache: {e}")
+# Every uvicorn worker shares this database, so a short-lived lease row lets
+# one worker fetch a missing key while the others wait for its cache row.
+# It outlives the upstream timeout, so a worker that dies mid-fetch only
+# holds the key that long
+FETCH_LEASE_SECONDS = 15
 
-def load_from_csv_cache(data_type: str, symbol: str) -> Optional[Dict[str, Any]]:
-    """Load API response data from CSV cache."""
-    file_path = get_csv_cache_path(data_type, symbol)
+def epoch_to_iso(value: Optional[int]) -> Optional[str]:
+    """Render a stored epoch timestamp for the cache management endpoints."""
+    return datetime.fromtimestamp(value).isoformat() if value is not None else None
 
-    if not is_cache_valid(file_path):
-        return None
+def encode_payload(raw_json: bytes) -> bytes:
+    """Compress a serialized JSON payload for storage."""
+    return zlib.compress(raw_json, PAYLOAD_COMPRESSION_LEVEL)
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            row = next(reader, None)
-            if row and row.get('raw_data'):
-                cached_data = json.loads(row['raw_data'])
-                logger.info(f"Loaded {data_type} data for {symbol} from CSV cache: {file_path}")
-                return cached_data
+def decode_payload(blob: bytes) -> Any:
+    """Decompress and parse a stored payload."""
+    return orjson.loads(zlib.decompress(blob))
 
-    except Exception as e:
-        logger.error(f"Failed to load {data_type} data for {symbol} from CSV cache: {e}")
+# Per-connection tuning; journal_mode=WAL persists in the file and is set once at init
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",   # Safe under WAL; skips the fsync on every commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",    # ~64 MB page cache
+    "PRAGMA mmap_size=268435456",  # Read through a 256 MB memory map
+    "PRAGMA busy_timeout=5000",
+)
 
-    return None
+# Idle connections for reuse across requests, so each use doesn't pay for
+# connect + PRAGMAs and keeps its page cache warm
+SQLITE_POOL_SIZE = 8
+_sqlite_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=SQLITE_POOL_SIZE)
 
-# ==============================================================================
-#  SQLite Caching System
-# ==============================================================================
-SQLITE_DB_PATH = Path("cache.db")
+def _open_sqlite_connection() -> sqlite3.Connection:
+    """Open and configure a new SQLite connection."""
+    # Pooled connections move between worker threads, but only one uses each at a time
+    conn = sqlite3.connect(str(SQLITE_DB_PATH), check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 @contextmanager
 def get_sqlite_connection():
-    """Context manager for SQLite database connections."""
-    conn = sqlite3.connect(str(SQLITE_DB_PATH))
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    """Context manager that borrows a SQLite connection from the pool."""
+    try:
+        conn = _sqlite_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_sqlite_connection()
     try:
         yield conn
     except Exception as e:
         conn.rollback()
         raise e
     finally:
-        conn.close()
+        # Never hand an open transaction to the next borrower
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _sqlite_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+def close_sqlite_pool() -> None:
+    """Close every idle pooled connection."""
+    while True:
+        try:
+            _sqlite_pool.get_nowait().close()
+        except queue.Empty:
+            return
 
 def init_sqlite_database():
     """Initialize SQLite database with required tables."""
     with get_sqlite_connection() as conn:
-        # Create cache table for all data types
+        # WAL lets the status/query endpoints read while a cache write is in progress
+        conn.execute('PRAGMA journal_mode=WAL')
+
+        # The database only holds cached API data, so rebuild it rather than
+        # migrate when it was created by an older schema version
+        if conn.execute('PRAGMA user_version').fetchone()[0] != SQLITE_SCHEMA_VERSION:
+            for table in SQLITE_TABLES:
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+
+        # Create cache table for all data types. The tables are keyed on their
+        # natural key WITHOUT ROWID, so the primary key is the lookup index
         conn.execute('''
             CREATE TABLE IF NOT EXISTS cache (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
                 data_type TEXT NOT NULL,
                 symbol TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                expires_at TEXT NOT NULL,
-                raw_data TEXT NOT NULL,
-                processed_data TEXT,
+                timestamp INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL,
+                raw_data BLOB NOT NULL,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(data_type, symbol)
-            )
+                PRIMARY KEY (data_type, symbol)
+            ) WITHOUT ROWID
         ''')
 
-        # Create index for faster lookups
+        # Payload lookups are served by the primary key; this covering index lets
+        # the status endpoint count fresh/expired rows without reading payload pages
         conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_cache_lookup
-            ON cache(data_type, symbol, expires_at)
+            CREATE INDEX IF NOT EXISTS idx_cache_expiry
+            ON cache(data_type, expires_at, timestamp)
         ''')
 
         # Create overview table for structured data
         conn.execute('''
             CREATE TABLE IF NOT EXISTS overview_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT UNIQUE NOT NULL,
+                symbol TEXT PRIMARY KEY NOT NULL,
                 name TEXT,
                 market_cap INTEGER,
                 pe_ratio REAL,
                 ebitda INTEGER,
-                timestamp TEXT NOT NULL,
-                expires_at TEXT NOT NULL
-            )
+                timestamp INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL
+            ) WITHOUT ROWID
         ''')
 
         # Create income statement table
         conn.execute('''
             CREATE TABLE IF NOT EXISTS income_statements (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
                 symbol TEXT NOT NULL,
                 fiscal_date_ending TEXT NOT NULL,
                 total_revenue INTEGER,
                 net_income INTEGER,
-                timestamp TEXT NOT NULL,
-                expires_at TEXT NOT NULL,
-                UNIQUE(symbol, fiscal_date_ending)
-            )
+                timestamp INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL,
+                PRIMARY KEY (symbol, fiscal_date_ending)
+            ) WITHOUT ROWID
         ''')
 
         # Create daily series table
         conn.execute('''
             CREATE TABLE IF NOT EXISTS daily_series (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
                 symbol TEXT NOT NULL,
                 date TEXT NOT NULL,
                 close_price REAL NOT NULL,
-                timestamp TEXT NOT NULL,
-                expires_at TEXT NOT NULL,
-                UNIQUE(symbol, date)
-            )
+                timestamp INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL,
+                PRIMARY KEY (symbol, date)
+            ) WITHOUT ROWID
+        ''')
+
+        # One row per key some worker is currently fetching from Alpha Vantage
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS fetch_leases (
+                data_type TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                expires_at INTEGER NOT NULL,
+                PRIMARY KEY (data_type, symbol)
+            ) WITHOUT ROWID
         ''')
 
+        conn.execute(f'PRAGMA user_version = {SQLITE_SCHEMA_VERSION}')
         conn.commit()
         logger.info("SQLite database initialized successfully")
 
-def save_to_sqlite_cache(data_type: str, symbol: str, data: Dict[str, Any]) -> None:
-    """Save API response data to SQLite cache."""
+# Hot-path statements, defined once. sqlite3 keeps prepared statements per
+# connection keyed by SQL text, and pooled connections keep that cache warm
+SQL_UPSERT_CACHE = '''
+    INSERT INTO cache (data_type, symbol, timestamp, expires_at, raw_data)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(data_type, symbol) DO UPDATE SET
+        timestamp = excluded.timestamp,
+        expires_at = excluded.expires_at,
+        raw_data = excluded.raw_data
+'''
+
+SQL_UPSERT_OVERVIEW = '''
+    INSERT INTO overview_data (symbol, name, market_cap, pe_ratio, ebitda, timestamp, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(symbol) DO UPDATE SET
+        name = excluded.name,
+        market_cap = excluded.market_cap,
+        pe_ratio = excluded.pe_ratio,
+        ebitda = excluded.ebitda,
+        timestamp = excluded.timestamp,
+        expires_at = excluded.expires_at
+'''
+
+SQL_UPSERT_INCOME = '''
+    INSERT INTO income_statements (symbol, fiscal_date_ending, total_revenue, net_income, timestamp, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(symbol, fiscal_date_ending) DO UPDATE SET
+        total_revenue = excluded.total_revenue,
+        net_income = excluded.net_income,
+        timestamp = excluded.timestamp,
+        expires_at = excluded.expires_at
+'''
+
+SQL_UPSERT_DAILY = '''
+    INSERT INTO daily_series (symbol, date, close_price, timestamp, expires_at)
+    SELECT ?, key, COALESCE(CAST(json_extract(value, '$."4. close"') AS REAL), 0), ?, ?
+    FROM json_each(?, '$."Time Series (Daily)"')
+    WHERE true
+    ON CONFLICT(symbol, date) DO UPDATE SET
+        close_price = excluded.close_price,
+        timestamp = excluded.timestamp,
+        expires_at = excluded.expires_at
+'''
+
+SQL_LOAD_CACHE = '''
+    SELECT raw_data, expires_at FROM cache
+    WHERE data_type = ? AND symbol = ? AND expires_at > ?
+'''
+
+# Inserts a lease, or takes over one that has lapsed; rowcount is 0 while
+# another worker's lease is live
+SQL_ACQUIRE_LEASE = '''
+    INSERT INTO fetch_leases (data_type, symbol, expires_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(data_type, symbol) DO UPDATE SET
+        expires_at = excluded.expires_at
+    WHERE fetch_leases.expires_at <= ?
+'''
+
+SQL_RELEASE_LEASE = 'DELETE FROM fetch_leases WHERE data_type = ? AND symbol = ?'
+
+SQL_LEASE_HELD = '''
+    SELECT 1 FROM fetch_leases
+    WHERE data_type = ? AND symbol = ? AND expires_at > ?
+'''
+
+def save_to_sqlite_cache(data_type: str, symbol: str, data: Dict[str, Any], expires_at: int, raw_json: Optional[bytes] = None) -> None:
+    """Save API response data to SQLite cache.
+
+    ``raw_json`` is the response body ``data`` was parsed from; when given it is
+    stored as-is instead of serializing ``data`` again.
+    """
     try:
-        expires_at = (datetime.now() + timedelta(days=CACHE_EXPIRY_DAYS)).isoformat()
-        timestamp = datetime.now().isoformat()
+        timestamp = int(time.time())
+
+        if raw_json is None:
+            raw_json = orjson.dumps(data)
+        payload = encode_payload(raw_json)
 
         with get_sqlite_connection() as conn:
             # Save raw data to cache table
-            conn.execute('''
-                REPLACE INTO cache (data_type, symbol, timestamp, expires_at, raw_data, processed_data)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
+            conn.execute(SQL_UPSERT_CACHE, (
                 data_type,
                 symbol.upper(),
                 timestamp,
                 expires_at,
-                json.dumps(data),
-                json.dumps(data)  # Can be customized for processed data
+                payload
             ))
+            # Release the fetch lease in the same commit, so a waiting worker
+            # never sees the key unleased before its row exists
+            conn.execute(SQL_RELEASE_LEASE, (data_type, symbol.upper()))
+            # Commit the cache row on its own: it is the only read path, so a
+            # failure in the structured tables below must not roll it back
+            conn.commit()
 
             # Save structured data to specific tables
             if data_type == "overview":
-                conn.execute('''
-                    REPLACE INTO overview_data (symbol, name, market_cap, pe_ratio, ebitda, timestamp, expires_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                conn.execute(SQL_UPSERT_OVERVIEW, (
                     symbol.upper(),
                     data.get('Name', ''),
-                    int(data.get('MarketCapitalization', 0) or 0),
-                    float(data.get('PERatio', 0) or 0),
-                    int(data.get('EBITDA', 0) or 0),
+                    to_int(data.get('MarketCapitalization')),
+                    to_float(data.get('PERatio')),
+                    to_int(data.get('EBITDA')),
                     timestamp,
                     expires_at
                 ))
 
             elif data_type == "income_statement":
-                # Save each annual report
-                for report in data.get('annualReports', []):
-                    conn.execute('''
-                        REPLACE INTO income_statements (symbol, fiscal_date_ending, total_revenue, net_income, timestamp, expires_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
+                # Save all annual reports in a single executemany call
+                rows = [
+                    (
                         symbol.upper(),
                         report.get('fiscalDateEnding', ''),
-                        int(report.get('totalRevenue', 0) or 0),
-                        int(report.get('netIncome', 0) or 0),
+                        to_int(report.get('totalRevenue')),
+                        to_int(report.get('netIncome')),
                         timestamp,
                         expires_at
-                    ))
+                    )
+                    for report in data.get('annualReports', [])
+                ]
+                conn.executemany(SQL_UPSERT_INCOME, rows)
 
             elif data_type == "daily_series":
-                # Save time series data
-                time_series = data.get('Time Series (Daily)', {})
-                for date, values in time_series.items():
-                    conn.execute('''
-                        REPLACE INTO daily_series (symbol, date, close_price, timestamp, expires_at)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        symbol.upper(),
-                        date,
-                        float(values.get('4. close', 0) or 0),
-                        timestamp,
-                        expires_at
-                    ))
+                # Let SQLite walk the time series itself with json_each, so the
+                # whole series is one statement with no per-row Python work
+                conn.execute(SQL_UPSERT_DAILY, (
+                    symbol.upper(),
+                    timestamp,
+                    expires_at,
+                    raw_json.decode('utf-8')
+                ))
 
             conn.commit()
-            logger.info(f"Saved {data_type} data for {symbol} to SQLite cache")
+            logger.debug("Saved %s data for %s to SQLite cache", data_type, symbol)
 
     except Exception as e:
         logger.error(f"Failed to save {data_type} data for {symbol} to SQLite cache: {e}")
+        # The row never landed, so don't leave other workers waiting on it
+        release_fetch_lease(data_type, symbol)
 
-def load_from_sqlite_cache(data_type: str, symbol: str) -> Optional[Dict[str, Any]]:
-    """Load API response data from SQLite cache."""
+def load_from_sqlite_cache(data_type: str, symbol: str) -> Optional[Tuple[Dict[str, Any], int]]:
+    """Load API response data from SQLite cache.
+
+    Returns the payload and its expires_at epoch; expired rows are returned as
+    stale until CACHE_STALE_GRACE_SECONDS past their expiry.
+    """
     try:
+        now = int(time.time())
         with get_sqlite_connection() as conn:
-            cursor = conn.execute('''
-                SELECT raw_data, expires_at FROM cache
-                WHERE data_type = ? AND symbol = ? AND expires_at > ?
-            ''', (data_type, symbol.upper(), datetime.now().isoformat()))
+            cursor = conn.execute(SQL_LOAD_CACHE, (data_type, symbol.upper(), now - CACHE_STALE_GRACE_SECONDS))
 
             row = cursor.fetchone()
             if row:
-                cached_data = json.loads(row['raw_data'])
-                logger.info(f"Loaded {data_type} data for {symbol} from SQLite cache")
-                return cached_data
+                return decode_payload(row['raw_data']), row['expires_at']
 
     except Exception as e:
         logger.error(f"Failed to load {data_type} data for {symbol} from SQLite cache: {e}")
 
     return None
 
+def acquire_fetch_lease(data_type: str, symbol: str) -> bool:
+    """Claim the right to fetch a key for this worker.
+
+    Returns False while another worker holds a live lease on it. Saving the
+    key's cache row releases the lease.
+    """
+    now = int(time.time())
+    try:
+        with get_sqlite_connection() as conn:
+            acquired = conn.execute(SQL_ACQUIRE_LEASE, (data_type, symbol.upper(), now + FETCH_LEASE_SECONDS, now)).rowcount == 1
+            conn.commit()
+            return acquired
+    except Exception as e:
+        # Fetching without a lease at worst duplicates an upstream call
+        logger.error(f"Failed to acquire fetch lease for {data_type} data for {symbol}: {e}")
+        return True
+
+def release_fetch_lease(data_type: str, symbol: str) -> None:
+    """Drop a lease after a failed fetch so other workers can retry at once."""
+    try:
+        with get_sqlite_connection() as conn:
+            conn.execute(SQL_RELEASE_LEASE, (data_type, symbol.upper()))
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to release fetch lease for {data_type} data for {symbol}: {e}")
+
+def poll_leased_key(data_type: str, symbol: str) -> Tuple[Optional[Tuple[Dict[str, Any], int]], bool]:
+    """Return the key's fresh cached payload and expiry, if any, and whether its lease is still live."""
+    cached = load_from_sqlite_cache(data_type, symbol)
+    if cached and cached[1] > time.time():
+        return cached, False
+    try:
+        with get_sqlite_connection() as conn:
+            held = conn.execute(SQL_LEASE_HELD, (data_type, symbol.upper(), int(time.time()))).fetchone() is not None
+    except Exception as e:
+        logger.error(f"Failed to check fetch lease for {data_type} data for {symbol}: {e}")
+        held = False
+    return None, held
+
 # Initialize SQLite database on startup
 init_sqlite_database()
 
@@ -347,33 +633,53 @@ app.add_middleware(
 # ==============================================================================
 
 # --- Helper functions for robust data cleaning ---
+# Placeholders Alpha Vantage uses for missing values (plus an absent key's
+# None); built once, not per call
+_SENTINELS = frozenset(("None", "", "N/A", "-", None))
+
 def to_float(value: Any) -> float:
-    if value is None or value in {"None", "", "N/A", "-"}: return 0.0
-    try: return float(value)
+    # Values that are already JSON numbers skip the sentinel and parse checks
+    if type(value) is float: return value
+    if type(value) is int: return float(value)
+    try:
+        # Unhashable junk raises TypeError here and takes the warning path below
+        if value in _SENTINELS: return 0.0
+        return float(value)
     except (ValueError, TypeError): 
-        logger.warning(f"Could not convert to float: {value}")
+        logger.warning("Could not convert to float: %r", value)
         return 0.0
 
 def to_int(value: Any) -> int:
-    if value is None or value in {"None", "", "N/A", "-"}: return 0
+    if type(value) is int: return value
+    if type(value) is float: return int(value)
+    # Integer strings ("4845540000") parse directly, skipping the float round-trip
+    try:
+        if value in _SENTINELS: return 0
+        return int(value)
+    except (ValueError, TypeError): pass
     try: return int(float(value))
     except (ValueError, TypeError): 
-        logger.warning(f"Could not convert to int: {value}")
+        logger.warning("Could not convert to int: %r", value)
         return 0
 
+def to_clean_str(value: Any) -> str:
+    if value is None or value in _SENTINELS:
+        return "Unknown"
+    return str(value).strip()
+
 # --- Models for Vendor Overview ---
+# Fields read Alpha Vantage's keys via validation_alias but dump under their
+# snake_case names, so model_dump() is already the API response shape
 class VendorOverview(BaseModel):
-    symbol: str = Field(alias="Symbol")
-    name: str = Field(alias="Name")
-    market_cap: int = Field(alias="MarketCapitalization")
-    pe_ratio: float = Field(alias="PERatio")
-    ebitda: int = Field(alias="EBITDA")
+    symbol: str = Field(validation_alias="Symbol")
+    name: str = Field(validation_alias="Name")
+    market_cap: int = Field(validation_alias="MarketCapitalization")
+    pe_ratio: float = Field(validation_alias="PERatio")
+    ebitda: int = Field(validation_alias="EBITDA")
 
     @field_validator('symbol', 'name', mode='before')
     def clean_string_fields(cls, v):
-        if v is None or v in {"None", "", "N/A", "-"}:
-            return "Unknown"
-        return str(v).strip()
+        return to_clean_str(v)
 
     @field_validator('market_cap', 'ebitda', mode='before')
     def clean_int_fields(cls, v): 
@@ -385,13 +691,11 @@ class VendorOverview(BaseModel):
 
 
 # --- Models for Income Statement (Deep Dive) ---
+# Response schemas only: the endpoint builds rows directly with to_int/to_float
 class IncomeReport(BaseModel):
-    fiscal_date_ending: str = Field(alias="fiscalDateEnding")
-    total_revenue: int = Field(alias="totalRevenue")
-    net_income: int = Field(alias="netIncome")
-
-    @field_validator('total_revenue', 'net_income', mode='before')
-    def clean_income_fields(cls, v): return to_int(v)
+    fiscal_date_ending: str
+    total_revenue: int
+    net_income: int
 
 class VendorIncomeStatement(BaseModel):
     symbol: str
@@ -402,28 +706,30 @@ class TimeSeriesData(BaseModel):
     date: str
     close: float
 
-    @field_validator('close', mode='before')
-    def clean_close_field(cls, v): return to_float(v)
-
 class VendorDailySeries(BaseModel):
     symbol: str
     time_series: List[TimeSeriesData]
 
 # --- Models for Symbol Search ---
 class SearchResult(BaseModel):
-    symbol: str = Field(alias="1. symbol")
-    name: str = Field(alias="2. name")
-    type: str = Field(alias="3. type")
-    region: str = Field(alias="4. region")
-    market_open: str = Field(alias="5. marketOpen")
-    market_close: str = Field(alias="6. marketClose")
-    timezone: str = Field(alias="7. timezone")
-    currency: str = Field(alias="8. currency")
-    match_score: float = Field(alias="9. matchScore")
+    symbol: str = Field(validation_alias="1. symbol")
+    name: str = Field(validation_alias="2. name")
+    type: str = Field(validation_alias="3. type")
+    region: str = Field(validation_alias="4. region")
+    market_open: str = Field(validation_alias="5. marketOpen")
+    market_close: str = Field(validation_alias="6. marketClose")
+    timezone: str = Field(validation_alias="7. timezone")
+    currency: str = Field(validation_alias="8. currency")
+    match_score: float = Field(validation_alias="9. matchScore")
 
 class VendorSearchResponse(BaseModel):
     results: List[SearchResult]
 
+# Validates a whole list of matches in one pydantic-core call instead of one per item
+SEARCH_RESULTS_ADAPTER = TypeAdapter(List[SearchResult])
+SEARCH_REGION = "United States"
+MAX_SEARCH_RESULTS = 20  # The search dropdown never shows more than this
+
 # Custom exception for our service layer to keep it decoupled from HTTP
 class APIError(Exception):
     def __init__(self, message: str, status_code: int):
@@ -434,23 +740,47 @@ class APIError(Exception):
 # ==============================================================================
 #  Core Service Logic (with Caching)
 # ==============================================================================
+_logged_http_version = False
+
+def log_upstream_http_version(http_version: str) -> None:
+    """Log the protocol negotiated with Alpha Vantage, once per process."""
+    global _logged_http_version
+    if not _logged_http_version:
+        _logged_http_version = True
+        logger.info("Alpha Vantage connection negotiated %s", http_version)
+
+@lru_cache(maxsize=1024)
+def upstream_url(params: ParamsKey, api_key: str) -> httpx.URL:
+    """Build the full Alpha Vantage URL for a params key once.
+
+    Passing a ready URL skips httpx's per-request query string merge. The API
+    key is part of the cache key, so /reload-env takes effect immediately.
+    """
+    return httpx.URL(f"{ALPHA_VANTAGE_BASE_URL}?{urlencode(params + (('apikey', api_key),))}")
+
 # Generic function to call the API and handle common errors
-@cached(cache)
-def fetch_alpha_vantage_data(params: frozenset) -> dict:
-    """A cached, generic function to fetch data from Alpha Vantage."""
-    # Convert frozenset back to dict for requests
+async def _call_alpha_vantage(params: ParamsKey) -> Tuple[dict, bytes]:
+    """Perform a single uncached request against Alpha Vantage.
+
+    Returns the parsed payload together with the response body it came from.
+    """
     params_dict = dict(params)
     func = params_dict.get('function', 'UNKNOWN')
     symbol = params_dict.get('symbol', '')
-    logger.info(f"CACHE MISS: Fetching fresh data for function '{func}' symbol '{symbol}'...")
-    
-    # Add the API key to every request
-    params_dict["apikey"] = ALPHA_VANTAGE_API_KEY
-    
+    logger.info("CACHE MISS: Fetching fresh data for function '%s' symbol '%s'...", func, symbol)
+
     try:
-        response = requests.get(ALPHA_VANTAGE_BASE_URL, params=params_dict, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        # Stream the body so an error status is raised before anything is
+        # downloaded and a runaway response can't be buffered without bound
+        async with upstream_slots, http_client.stream("GET", upstream_url(params, ALPHA_VANTAGE_API_KEY)) as response:
+            response.raise_for_status()
+            log_upstream_http_version(response.http_version)
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > MAX_UPSTREAM_RESPONSE_BYTES:
+                    raise APIError("Response from external API was too large.", 502)
+        data = orjson.loads(body)
 
         if not data:
             raise APIError("No data returned from API.", 404)
@@ -459,10 +789,312 @@ def fetch_alpha_vantage_data(params: frozenset) -> dict:
         if "Error Message" in data:
             raise APIError(f"Invalid API call. Error: {data['Error Message']}", 400)
 
+        return data, bytes(body)
+    except (httpx.HTTPError, ValueError) as e:
+        # Never put str(e) here: httpx errors include the request URL, whose
+        # query string carries the API key
+        if isinstance(e, httpx.HTTPStatusError):
+            reason = f"HTTP {e.response.status_code}"
+        elif isinstance(e, httpx.HTTPError):
+            reason = type(e).__name__
+        else:
+            reason = "invalid JSON in response"
+        logger.error("External API communication error for %s %s: %s", func, symbol, reason)
+        raise APIError(f"Error communicating with external API: {reason}", 503)
+
+def remember_payload(cache: TTLCache, params: ParamsKey, data: dict, expires_at: float) -> None:
+    """Put a payload in its memory cache along with when it stops being fresh."""
+    cache[params] = data
+    payload_expiry[params] = (data, expires_at)
+
+def payload_fresh_until(params: ParamsKey, data: dict) -> float:
+    """Epoch until which a payload is fresh; 0 when its expiry isn't known."""
+    entry = payload_expiry.get(params)
+    return entry[1] if entry is not None and entry[0] is data else 0.0
+
+def _function_of(params: ParamsKey) -> Optional[str]:
+    for name, value in params:
+        if name == "function":
+            return value
+    return None
+
+def _cache_for(params: ParamsKey) -> TTLCache:
+    """Pick the TTL cache matching the params' Alpha Vantage function."""
+    return caches.get(_function_of(params), default_cache)
+
+def data_ttl(params: ParamsKey) -> int:
+    """How long a fresh fetch for these params stays fresh."""
+    return DATA_TTL_SECONDS.get(_function_of(params), DEFAULT_DATA_TTL_SECONDS)
+
+async def _single_flight(
+    inflight: Dict[ParamsKey, asyncio.Future],
+    params: ParamsKey,
+    load: Callable[[], Awaitable[dict]],
+) -> dict:
+    """Run ``load`` once for concurrent callers with the same params.
+
+    The first caller runs it and everyone else awaits the same future.
+    """
+    pending = inflight.get(params)
+    if pending is not None:
+        # Shielded, so a follower that is cancelled (a client disconnect, a
+        # cancelled background task) doesn't cancel the future for everyone else
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    inflight[params] = future
+    try:
+        data = await load()
+    except asyncio.CancelledError:
+        if not future.done():
+            future.cancel()
+        raise
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved when nobody else was waiting
+        raise
+    else:
+        if not future.done():
+            future.set_result(data)
         return data
-    except requests.exceptions.RequestException as e:
-        logger.error(f"External API communication error for {func} {symbol}: {e}")
-        raise APIError(f"Error communicating with external API: {e}", 503)
+    finally:
+        del inflight[params]
+
+async def fetch_alpha_vantage_data(
+    params: ParamsKey,
+    on_fetch: Optional[OnFetch] = None,
+) -> dict:
+    """A cached, generic function to fetch data from Alpha Vantage.
+
+    Concurrent misses for the same params share one upstream request. Only the
+    caller that issued it runs ``on_fetch``, with the payload, the raw body and
+    its expiry.
+    """
+    cache = _cache_for(params)
+    cached_data = cache.get(params)
+    if cached_data is not None:
+        return cached_data
+    return await _single_flight(_inflight, params, partial(_fetch_and_cache, params, cache, on_fetch))
+
+async def _fetch_and_cache(
+    params: ParamsKey,
+    cache: TTLCache,
+    on_fetch: Optional[OnFetch],
+) -> dict:
+    data, body = await _call_alpha_vantage(params)
+    expires_at = int(time.time()) + data_ttl(params)
+    remember_payload(cache, params, data, expires_at)
+    if on_fetch is not None:
+        on_fetch(data, body, expires_at)
+    return data
+
+async def load_vendor_data(data_type: str, ticker: str, params: ParamsKey) -> dict:
+    """Return raw vendor data from memory, then SQLite, then a fresh fetch.
+
+    Concurrent misses share one SQLite read and, past that, one upstream call.
+    """
+    # Hot tickers are answered from the in-process cache without a thread hop
+    cache = _cache_for(params)
+    cached_data = cache.get(params)
+    if cached_data is not None:
+        # A stale row stays in memory for the full TTL; keep retrying its
+        # refresh while it is served
+        if payload_fresh_until(params, cached_data) <= time.time():
+            schedule_refresh(data_type, ticker, params)
+        return cached_data
+    return await _single_flight(_loading, params, partial(_load_uncached, data_type, ticker, params, cache))
+
+async def _load_uncached(data_type: str, ticker: str, params: ParamsKey, cache: TTLCache) -> dict:
+    # SQLite I/O runs in a worker thread so it never blocks the event loop
+    cached = await asyncio.to_thread(load_from_sqlite_cache, data_type, ticker)
+    if cached:
+        cached_data, expires_at = cached
+        # Hits are the common case; keep them out of the INFO log
+        logger.debug("Using cached %s data for %s", data_type, ticker)
+        if expires_at <= time.time():
+            # Serve the stale copy now and replace it off the request path
+            schedule_refresh(data_type, ticker, params)
+        remember_payload(cache, params, cached_data, expires_at)
+        return cached_data
+
+    # Another worker may already be fetching this key; share its result
+    if not await asyncio.to_thread(acquire_fetch_lease, data_type, ticker):
+        cached = await _wait_for_lease_holder(data_type, ticker)
+        if cached is not None:
+            remember_payload(cache, params, *cached)
+            return cached[0]
+        # The holder failed or timed out; fetch it ourselves
+        if not await asyncio.to_thread(acquire_fetch_lease, data_type, ticker):
+            return await fetch_alpha_vantage_data(params, partial(schedule_cache_save, data_type, ticker))
+
+    # Fetch from API if not in cache; whichever request actually went upstream
+    # persists the result, so a burst of misses is written once
+    return await _fetch_under_lease(data_type, ticker, partial(fetch_alpha_vantage_data, params))
+
+async def _fetch_under_lease(
+    data_type: str,
+    ticker: str,
+    fetch: Callable[[OnFetch], Awaitable[dict]],
+) -> dict:
+    """Run ``fetch`` while holding the key's lease, passing it the save callback.
+
+    Saving the fetched payload releases the lease. When this caller's save never
+    runs (the fetch failed, or joined another caller's fetch or a memory hit),
+    the lease is released here so other workers don't wait it out.
+    """
+    saved = False
+
+    def save(raw_data: dict, raw_json: bytes, expires_at: int) -> None:
+        nonlocal saved
+        saved = True
+        schedule_cache_save(data_type, ticker, raw_data, raw_json, expires_at)
+
+    try:
+        return await fetch(save)
+    finally:
+        if not saved:
+            await asyncio.to_thread(release_fetch_lease, data_type, ticker)
+
+async def _wait_for_lease_holder(data_type: str, ticker: str) -> Optional[Tuple[dict, int]]:
+    """Poll SQLite for the row another worker is fetching.
+
+    Returns None once its lease is gone without a fresh row appearing.
+    """
+    delay = 0.05
+    deadline = time.monotonic() + FETCH_LEASE_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.25)
+        cached, held = await asyncio.to_thread(poll_leased_key, data_type, ticker)
+        if cached is not None or not held:
+            return cached
+    return None
+
+def schedule_refresh(data_type: str, ticker: str, params: ParamsKey) -> None:
+    """Refetch stale data in the background.
+
+    Skipped while a fetch for the key is running or one was started within the
+    last STALE_REFRESH_RETRY_SECONDS.
+    """
+    if params in _inflight or params in _recent_refreshes:
+        return
+    _recent_refreshes[params] = True
+    task = asyncio.create_task(_refresh(data_type, ticker, params))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+async def _refresh(data_type: str, ticker: str, params: ParamsKey) -> None:
+    # Only one worker refreshes a key; the others keep serving the stale copy
+    if not await asyncio.to_thread(acquire_fetch_lease, data_type, ticker):
+        return
+    # Goes straight to the single-flight fetch: the memory cache holds the stale copy
+    cache = _cache_for(params)
+    try:
+        await _fetch_under_lease(
+            data_type, ticker,
+            lambda save: _single_flight(_inflight, params, partial(_fetch_and_cache, params, cache, save)),
+        )
+    except Exception as e:
+        # Rate limits and outages just mean the stale copy is served a while longer
+        logger.warning("Background refresh of %s for %s failed: %s", data_type, ticker, e)
+
+def schedule_cache_save(data_type: str, ticker: str, raw_data: dict, raw_json: bytes, expires_at: int) -> None:
+    """Persist in the background; the response doesn't wait for the disk."""
+    task = asyncio.create_task(asyncio.to_thread(save_to_sqlite_cache, data_type, ticker, raw_data, expires_at, raw_json))
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+
+# --- Response builders (raw Alpha Vantage payload -> snake_case API shape) ---
+# (Alpha Vantage key, response field, cleaner) for each VendorOverview field
+OVERVIEW_FIELDS = (
+    ("Symbol", "symbol", to_clean_str),
+    ("Name", "name", to_clean_str),
+    ("MarketCapitalization", "market_cap", to_int),
+    ("PERatio", "pe_ratio", to_float),
+    ("EBITDA", "ebitda", to_int),
+)
+
+def build_overview(raw_data: dict) -> dict:
+    """Project an OVERVIEW payload onto the dashboard fields."""
+    # The cleaners are the same ones VendorOverview's validators use, so a
+    # direct projection gives the same snake_case dict without building a model
+    try:
+        return {field: clean(raw_data[key]) for key, field, clean in OVERVIEW_FIELDS}
+    except KeyError:
+        # Let pydantic raise the ValidationError naming the missing fields
+        return VendorOverview.model_validate(raw_data).model_dump()
+
+async def get_overview_response(ticker: str) -> Tuple[dict, bytes, str, float]:
+    """Return a ticker's overview_responses entry, built once per payload."""
+    params = overview_params(ticker)
+    raw_data = await load_vendor_data("overview", ticker, params)
+
+    # Reuse the bytes only while they were built from the payload now cached, so
+    # a refetch or background refresh is picked up immediately
+    cached = overview_responses.get(ticker)
+    if cached is not None and cached[0] is raw_data:
+        return cached
+
+    # Lazy %-formatting: nothing is built unless DEBUG is enabled
+    logger.debug("Raw data keys for %s: %s", ticker, raw_data.keys())
+
+    content = orjson.dumps(build_overview(raw_data))
+    etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+    # Clients may cache it no longer than this entry lives, and not past the
+    # payload's own expiry: a stale row being refreshed must not be pinned downstream
+    fresh_until = min(time.time() + OVERVIEW_RESPONSE_TTL, payload_fresh_until(params, raw_data))
+    entry = (raw_data, content, etag, fresh_until)
+    overview_responses[ticker] = entry
+    return entry
+
+async def get_overview_bytes(ticker: str) -> bytes:
+    """Return the serialized overview response for a ticker."""
+    return (await get_overview_response(ticker))[1]
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches the ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+async def prefetch_overviews(tickers: Tuple[str, ...]) -> None:
+    """Load each ticker's overview so the first dashboard request is a cache hit."""
+    # Goes through the normal load path: fresh SQLite rows cost no upstream call
+    # and the upstream semaphore throttles whatever does miss
+    results = await asyncio.gather(*(get_overview_bytes(t) for t in tickers), return_exceptions=True)
+    failed = [t for t, result in zip(tickers, results) if isinstance(result, Exception)]
+    if failed:
+        logger.warning("Prefetch failed for: %s", ", ".join(failed))
+    logger.info("Prefetched %d of %d overviews", len(tickers) - len(failed), len(tickers))
+
+def build_income_statement(ticker: str, raw_data: dict) -> dict:
+    """Project an INCOME_STATEMENT payload, cleaning each annual report inline."""
+    return {
+        "symbol": raw_data.get("symbol", ticker),
+        "annual_reports": [
+            {
+                "fiscal_date_ending": report.get("fiscalDateEnding", ""),
+                "total_revenue": to_int(report.get("totalRevenue")),
+                "net_income": to_int(report.get("netIncome"))
+            }
+            for report in raw_data.get("annualReports", [])
+        ]
+    }
+
+_close_price = itemgetter("4. close")
+
+def build_daily_series(ticker: str, raw_data: dict) -> dict:
+    """Transform a TIME_SERIES_DAILY payload's dict of dates into a list of objects."""
+    time_series_raw = raw_data.get("Time Series (Daily)", {})
+    return {
+        "symbol": raw_data.get("Meta Data", {}).get("2. Symbol", ticker),
+        "time_series": [
+            {"date": date, "close": to_float(_close_price(details))}
+            for date, details in time_series_raw.items()
+        ]
+    }
 
 # ==============================================================================
 #  API Endpoints
@@ -470,8 +1102,9 @@ def fetch_alpha_vantage_data(params: frozenset) -> dict:
 
 # --- Main Dashboard Endpoint ---
 @app.get("/", tags=["Status"])
-def read_root():
+async def read_root():
     """A simple health check endpoint to confirm the API is running."""
+    # async so health-check polling never waits on a threadpool slot
     return {"status": "API is running", "docs_url": "/docs"}
 
 @app.post("/reload-env", tags=["Status"])
@@ -487,11 +1120,14 @@ def reload_environment_variables():
         return {"status": "error", "message": f"Failed to reload environment variables: {str(e)}"}
 
 @app.get("/test/{ticker}", tags=["Status"])
-def test_api_connection(ticker: str):
+async def test_api_connection(ticker: str):
     """Test endpoint to debug Alpha Vantage connection."""
+    ticker = normalize_ticker(ticker)
     try:
-        params = frozenset({"function": "OVERVIEW", "symbol": ticker.upper()}.items())
-        raw_data = fetch_alpha_vantage_data(params)
+        params = overview_params(ticker)
+        # Persist like any other fetch, so an overview request that joins this
+        # one still gets its SQLite row
+        raw_data = await fetch_alpha_vantage_data(params, partial(schedule_cache_save, "overview", ticker))
         return {
             "status": "success",
             "ticker": ticker,
@@ -508,52 +1144,47 @@ def test_api_connection(ticker: str):
             "error_type": type(e).__name__
         }
 
-@app.get("/csv-cache/status", tags=["Cache Management"])
-def get_csv_cache_status():
-    """Get status of CSV cache files."""
-    cache_files = []
-
-    if CSV_CACHE_DIR.exists():
-        for file_path in CSV_CACHE_DIR.glob("*.csv"):
-            try:
-                file_stats = file_path.stat()
-                cache_files.append({
-                    "filename": file_path.name,
-                    "data_type": file_path.stem.split('_')[0],
-                    "symbol": '_'.join(file_path.stem.split('_')[1:]),
-                    "size_bytes": file_stats.st_size,
-                    "created": datetime.fromtimestamp(file_stats.st_ctime).isoformat(),
-                    "modified": datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
-                    "is_valid": is_cache_valid(file_path),
-                    "expires_in_days": CACHE_EXPIRY_DAYS - (datetime.now() - datetime.fromtimestamp(file_stats.st_mtime)).days
-                })
-            except Exception as e:
-                logger.error(f"Error reading cache file {file_path}: {e}")
-
-    return {
-        "cache_directory": str(CSV_CACHE_DIR.absolute()),
-        "cache_expiry_days": CACHE_EXPIRY_DAYS,
-        "total_files": len(cache_files),
-        "files": cache_files
-    }
-
-@app.delete("/csv-cache/clear", tags=["Cache Management"])
-def clear_csv_cache():
-    """Clear all CSV cache files."""
-    deleted_files = []
-
-    if CSV_CACHE_DIR.exists():
-        for file_path in CSV_CACHE_DIR.glob("*.csv"):
-            try:
-                file_path.unlink()
-                deleted_files.append(file_path.name)
-            except Exception as e:
-                logger.error(f"Error deleting cache file {file_path}: {e}")
-
-    return {
-        "message": f"Cleared {len(deleted_files)} cache files",
-        "deleted_files": deleted_files
-    }
+# Structured tables a symbol can be exported from: data_type -> (table, columns)
+CSV_EXPORTS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "overview": ("overview_data", ("symbol", "name", "market_cap", "pe_ratio", "ebitda")),
+    "income_statement": ("income_statements", ("fiscal_date_ending", "total_revenue", "net_income")),
+    "daily_series": ("daily_series", ("date", "close_price")),
+}
+
+class _CSVLine:
+    """File-like sink that hands each formatted CSV row straight back."""
+    def write(self, line: str) -> str:
+        return line
+
+def iter_csv_export(symbol: str, table: str, columns: Tuple[str, ...]):
+    """Yield CSV lines for one symbol's rows, straight off the SQLite cursor."""
+    writer = csv.writer(_CSVLine())
+    yield writer.writerow(columns)
+    with get_sqlite_connection() as conn:
+        # table and columns come from CSV_EXPORTS, never from the request
+        cursor = conn.execute(
+            f"SELECT {', '.join(columns)} FROM {table} WHERE symbol = ? ORDER BY {columns[0]}",
+            (symbol,)
+        )
+        for row in cursor:
+            yield writer.writerow(row)
+
+@app.get("/export/{symbol}.csv", tags=["Cache Management"])
+def export_csv(symbol: str, data_type: str = "daily_series"):
+    """Stream a symbol's cached structured data as CSV."""
+    symbol = normalize_ticker(symbol)
+    if data_type not in CSV_EXPORTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown data_type '{data_type}'. Expected one of: {', '.join(CSV_EXPORTS)}."
+        )
+
+    table, columns = CSV_EXPORTS[data_type]
+    return StreamingResponse(
+        iter_csv_export(symbol, table, columns),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{data_type}_{symbol}.csv"'}
+    )
 
 @app.get("/sqlite-cache/status", tags=["Cache Management"])
 def get_sqlite_cache_status():
@@ -567,16 +1198,19 @@ def get_sqlite_cache_status():
                     COUNT(*) as count,
                     MIN(timestamp) as oldest_entry,
                     MAX(timestamp) as newest_entry,
-                    COUNT(CASE WHEN expires_at > ? THEN 1 END) as valid_entries,
-                    COUNT(CASE WHEN expires_at <= ? THEN 1 END) as expired_entries
+                    COUNT(CASE WHEN expires_at > :now THEN 1 END) as valid_entries,
+                    COUNT(CASE WHEN expires_at <= :now THEN 1 END) as expired_entries
                 FROM cache
                 GROUP BY data_type
-            ''', (datetime.now().isoformat(), datetime.now().isoformat())).fetchall()
+            ''', {"now": int(time.time())}).fetchall()
 
-            # Get overview data stats
-            overview_count = conn.execute('SELECT COUNT(*) FROM overview_data').fetchone()[0]
-            income_count = conn.execute('SELECT COUNT(*) FROM income_statements').fetchone()[0]
-            series_count = conn.execute('SELECT COUNT(*) FROM daily_series').fetchone()[0]
+            # Get structured table stats in a single statement
+            overview_count, income_count, series_count = conn.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM overview_data),
+                    (SELECT COUNT(*) FROM income_statements),
+                    (SELECT COUNT(*) FROM daily_series)
+            ''').fetchone()
 
             # Get database file size
             db_size = SQLITE_DB_PATH.stat().st_size if SQLITE_DB_PATH.exists() else 0
@@ -584,8 +1218,15 @@ def get_sqlite_cache_status():
             return {
                 "database_path": str(SQLITE_DB_PATH.absolute()),
                 "database_size_bytes": db_size,
-                "cache_expiry_days": CACHE_EXPIRY_DAYS,
-                "cache_stats": [dict(row) for row in cache_stats],
+                "cache_expiry_seconds": DATA_TTL_SECONDS,
+                "cache_stats": [
+                    {
+                        **dict(row),
+                        "oldest_entry": epoch_to_iso(row["oldest_entry"]),
+                        "newest_entry": epoch_to_iso(row["newest_entry"])
+                    }
+                    for row in cache_stats
+                ],
                 "structured_data": {
                     "overview_records": overview_count,
                     "income_statement_records": income_count,
@@ -602,17 +1243,11 @@ def clear_sqlite_cache():
     """Clear all SQLite cache data."""
     try:
         with get_sqlite_connection() as conn:
-            # Get counts before deletion
-            cache_count = conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
-            overview_count = conn.execute('SELECT COUNT(*) FROM overview_data').fetchone()[0]
-            income_count = conn.execute('SELECT COUNT(*) FROM income_statements').fetchone()[0]
-            series_count = conn.execute('SELECT COUNT(*) FROM daily_series').fetchone()[0]
-
-            # Clear all tables
-            conn.execute('DELETE FROM cache')
-            conn.execute('DELETE FROM overview_data')
-            conn.execute('DELETE FROM income_statements')
-            conn.execute('DELETE FROM daily_series')
+            # Clear all tables; each DELETE reports how many rows it removed
+            cache_count = conn.execute('DELETE FROM cache').rowcount
+            overview_count = conn.execute('DELETE FROM overview_data').rowcount
+            income_count = conn.execute('DELETE FROM income_statements').rowcount
+            series_count = conn.execute('DELETE FROM daily_series').rowcount
             conn.commit()
 
             return {
@@ -653,11 +1288,18 @@ def query_sqlite_cache(
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
 
-            results = conn.execute(query, params).fetchall()
+            results = []
+            for row in conn.execute(query, params).fetchall():
+                entry = dict(row)
+                # Payloads are stored compressed; return them as JSON text
+                entry['raw_data'] = zlib.decompress(entry['raw_data']).decode('utf-8')
+                entry['timestamp'] = epoch_to_iso(entry['timestamp'])
+                entry['expires_at'] = epoch_to_iso(entry['expires_at'])
+                results.append(entry)
 
             return {
                 "query_params": {"data_type": data_type, "symbol": symbol, "limit": limit},
-                "results": [dict(row) for row in results]
+                "results": results
             }
 
     except Exception as e:
@@ -665,177 +1307,169 @@ def query_sqlite_cache(
         return {"error": str(e)}
 
 # --- Main Dashboard Endpoint ---
-@app.get("/api/vendor/{ticker}/overview", tags=["Vendors"])
-def get_vendor_overview(ticker: str):
-    """Fetches curated overview data for the main dashboard table."""
+@app.get("/api/vendor/{ticker}/overview", tags=["Vendors"], responses={200: {"model": VendorOverview}})
+async def get_vendor_overview(ticker: str, if_none_match: Optional[str] = Header(default=None)):
+    """Fetches curated overview data for the main dashboard table.
+
+    Responses carry an ETag and a Cache-Control max-age covering the rest of
+    the server-side cache lifetime; a matching If-None-Match gets a 304.
+    """
+    ticker = normalize_ticker(ticker)
     try:
-        # Try to load from SQLite cache first, then CSV cache
-        cached_data = load_from_sqlite_cache("overview", ticker)
-        if not cached_data:
-            cached_data = load_from_csv_cache("overview", ticker)
-
-        if cached_data:
-            logger.info(f"Using cached overview data for {ticker}")
-            raw_data = cached_data
-        else:
-            # Fetch from API if not in cache
-            params = frozenset({"function": "OVERVIEW", "symbol": ticker.upper()}.items())
-            raw_data = fetch_alpha_vantage_data(params)
-
-            # Save to both CSV and SQLite cache for future use
-            save_to_csv_cache("overview", ticker, raw_data)
-            save_to_sqlite_cache("overview", ticker, raw_data)
-
-        # Add debug logging
-        logger.info(f"Raw data keys for {ticker}: {list(raw_data.keys())}")
-
-        # Validate and convert to our format
-        validated_data = VendorOverview.model_validate(raw_data)
-
-        # Return with snake_case field names (matching frontend expectations)
-        return {
-            "symbol": validated_data.symbol,
-            "name": validated_data.name,
-            "market_cap": validated_data.market_cap,
-            "pe_ratio": validated_data.pe_ratio,
-            "ebitda": validated_data.ebitda
-        }
+        _, content, etag, fresh_until = await get_overview_response(ticker)
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except ValidationError as e:
-        logger.error(f"Validation failed for {ticker} overview: {e}")
-        logger.error(f"Raw data was: {raw_data}")
+        # The validation error already names each offending field and value
+        logger.exception("Validation failed for %s overview", ticker)
         raise HTTPException(status_code=422, detail=f"Unexpected data format from external API: {str(e)}")
     except Exception as e:
         logger.critical(f"Unexpected error for {ticker} overview: {e}")
         raise HTTPException(status_code=500, detail="Internal server error.")
 
-# --- Deep Dive Modal Endpoints ---
-@app.get("/api/vendor/{ticker}/income-statement", tags=["Vendors"])
-def get_income_statement(ticker: str):
-    """Fetches annual income statement data for the deep-dive modal."""
-    try:
-        # Try to load from SQLite cache first, then CSV cache
-        cached_data = load_from_sqlite_cache("income_statement", ticker)
-        if not cached_data:
-            cached_data = load_from_csv_cache("income_statement", ticker)
-
-        if cached_data:
-            logger.info(f"Using cached income statement data for {ticker}")
-            raw_data = cached_data
+    max_age = max(int(fresh_until - time.time()), 0)
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={OVERVIEW_STALE_WHILE_REVALIDATE}",
+        "ETag": etag,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+MAX_BATCH_TICKERS = 50  # A full batch of misses is already a large share of the daily quota
+
+@app.get("/api/vendor/overview", tags=["Vendors"])
+async def get_vendor_overviews(tickers: str):
+    """Fetches overview data for a comma-separated list of tickers in one request.
+
+    Tickers load concurrently and fail independently: successful overviews are
+    returned under "results" in request order, failures under "errors".
+    """
+    requested = list(dict.fromkeys(t.strip() for t in tickers.split(",") if t.strip()))
+    if not requested:
+        raise HTTPException(status_code=400, detail="No tickers given.")
+    if len(requested) > MAX_BATCH_TICKERS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_TICKERS} tickers per request.")
+
+    # An invalid ticker is reported like any other per-ticker failure
+    errors: Dict[str, Dict[str, Any]] = {}
+    symbols: List[str] = []
+    for ticker in requested:
+        try:
+            symbols.append(normalize_ticker(ticker))
+        except HTTPException as e:
+            errors[ticker] = {"status_code": e.status_code, "detail": e.detail}
+    symbols = list(dict.fromkeys(symbols))  # "ce" and "CE" are the same ticker
+
+    results = await asyncio.gather(*(get_overview_bytes(t) for t in symbols), return_exceptions=True)
+
+    overviews: List[bytes] = []
+    for ticker, result in zip(symbols, results):
+        if isinstance(result, APIError):
+            errors[ticker] = {"status_code": result.status_code, "detail": result.message}
+        elif isinstance(result, ValidationError):
+            logger.error(f"Validation failed for {ticker} overview: {result}")
+            errors[ticker] = {"status_code": 422, "detail": "Unexpected data format from external API."}
+        elif isinstance(result, BaseException):
+            logger.critical(f"Unexpected error for {ticker} overview: {result}")
+            errors[ticker] = {"status_code": 500, "detail": "Internal server error."}
         else:
-            # Fetch from API if not in cache
-            params = frozenset({"function": "INCOME_STATEMENT", "symbol": ticker.upper()}.items())
-            raw_data = fetch_alpha_vantage_data(params)
-
-            # Save to both CSV and SQLite cache for future use
-            save_to_csv_cache("income_statement", ticker, raw_data)
-            save_to_sqlite_cache("income_statement", ticker, raw_data)
+            overviews.append(result)
 
-        # Manually construct the response while validating the nested list
-        validated_reports = [IncomeReport.model_validate(report) for report in raw_data.get("annualReports", [])]
+    # The overviews are already serialized, so splice them in rather than re-encode
+    content = b'{"results":[' + b",".join(overviews) + b'],"errors":' + orjson.dumps(errors) + b"}"
+    return Response(content=content, media_type="application/json")
 
-        # Return with snake_case field names
-        return {
-            "symbol": raw_data.get("symbol", ticker.upper()),
-            "annual_reports": [
-                {
-                    "fiscal_date_ending": report.fiscal_date_ending,
-                    "total_revenue": report.total_revenue,
-                    "net_income": report.net_income
-                }
-                for report in validated_reports
-            ]
-        }
+# --- Deep Dive Modal Endpoints ---
+@app.get("/api/vendor/{ticker}/income-statement", tags=["Vendors"], responses={200: {"model": VendorIncomeStatement}})
+async def get_income_statement(ticker: str):
+    """Fetches annual income statement data for the deep-dive modal."""
+    ticker = normalize_ticker(ticker)
+    try:
+        raw_data = await load_vendor_data("income_statement", ticker, income_params(ticker))
+        return build_income_statement(ticker, raw_data)
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
-    except ValidationError as e:
-        logger.error(f"Validation failed for {ticker} income statement: {e}")
-        raise HTTPException(status_code=422, detail="Unexpected data format for income statement.")
     except Exception as e:
         logger.critical(f"Unexpected error for {ticker} income statement: {e}")
         raise HTTPException(status_code=500, detail="Internal server error.")
 
-@app.get("/api/vendor/{ticker}/daily-series", tags=["Vendors"])
-def get_daily_series(ticker: str):
+@app.get("/api/vendor/{ticker}/daily-series", tags=["Vendors"], responses={200: {"model": VendorDailySeries}})
+async def get_daily_series(ticker: str):
     """Fetches the last 100 days of stock data for the deep-dive chart."""
+    ticker = normalize_ticker(ticker)
     try:
-        # Try to load from SQLite cache first, then CSV cache
-        cached_data = load_from_sqlite_cache("daily_series", ticker)
-        if not cached_data:
-            cached_data = load_from_csv_cache("daily_series", ticker)
-
-        if cached_data:
-            logger.info(f"Using cached daily series data for {ticker}")
-            raw_data = cached_data
-        else:
-            # Fetch from API if not in cache
-            params = frozenset({"function": "TIME_SERIES_DAILY", "symbol": ticker.upper(), "outputsize": "compact"}.items())
-            raw_data = fetch_alpha_vantage_data(params)
-
-            # Save to both CSV and SQLite cache for future use
-            save_to_csv_cache("daily_series", ticker, raw_data)
-            save_to_sqlite_cache("daily_series", ticker, raw_data)
-
-        time_series_raw = raw_data.get("Time Series (Daily)", {})
-        # Transform the data from a dict of dates to a list of objects, with validation
-        time_series_list = [
-            TimeSeriesData.model_validate({"date": date, "close": details["4. close"]})
-            for date, details in time_series_raw.items()
-        ]
-
-        # Return with snake_case field names
-        return {
-            "symbol": raw_data.get("Meta Data", {}).get("2. Symbol", ticker.upper()),
-            "time_series": [
-                {
-                    "date": item.date,
-                    "close": item.close
-                }
-                for item in time_series_list
-            ]
-        }
-    except (APIError, ValidationError) as e:
-        status = e.status_code if isinstance(e, APIError) else 422
-        detail = e.message if isinstance(e, APIError) else "Unexpected data format for daily series."
-        logger.error(f"Failed to get daily series for {ticker}: {detail}")
-        raise HTTPException(status_code=status, detail=detail)
+        raw_data = await load_vendor_data("daily_series", ticker, daily_params(ticker))
+        return build_daily_series(ticker, raw_data)
+    except APIError as e:
+        logger.error(f"Failed to get daily series for {ticker}: {e.message}")
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.critical(f"Unexpected error for {ticker} daily series: {e}")
         raise HTTPException(status_code=500, detail="Internal server error.")
 
+@app.get("/api/vendor/{ticker}/deep-dive", tags=["Vendors"])
+async def get_vendor_deep_dive(ticker: str):
+    """Fetches overview, income statement and daily series concurrently for the deep-dive modal.
+
+    Each section is reported independently: a failed section is returned as None
+    with its status and detail under "errors", and the request only fails outright
+    when every section does.
+    """
+    ticker = normalize_ticker(ticker)
+    results = await asyncio.gather(
+        load_vendor_data("overview", ticker, overview_params(ticker)),
+        load_vendor_data("income_statement", ticker, income_params(ticker)),
+        load_vendor_data("daily_series", ticker, daily_params(ticker)),
+        return_exceptions=True,
+    )
+    builders = (
+        ("overview", build_overview),
+        ("income_statement", partial(build_income_statement, ticker)),
+        ("daily_series", partial(build_daily_series, ticker)),
+    )
+
+    response: Dict[str, Any] = {"symbol": ticker}
+    response.update((section, None) for section, _ in builders)
+    response["errors"] = {}
+    for (section, build), result in zip(builders, results):
+        try:
+            if isinstance(result, BaseException):
+                raise result
+            response[section] = build(result)
+        except APIError as e:
+            response["errors"][section] = {"status_code": e.status_code, "detail": e.message}
+        except ValidationError as e:
+            logger.error(f"Validation failed for {ticker} {section}: {e}")
+            response["errors"][section] = {"status_code": 422, "detail": "Unexpected data format from external API."}
+        except Exception as e:
+            logger.critical(f"Unexpected error for {ticker} {section}: {e}")
+            response["errors"][section] = {"status_code": 500, "detail": "Internal server error."}
+
+    if len(response["errors"]) == len(builders):
+        first_error = response["errors"]["overview"]
+        raise HTTPException(status_code=first_error["status_code"], detail=first_error["detail"])
+    return response
+
 
 # --- Dynamic Search Endpoint ---
-@app.get("/api/search/{keywords}", tags=["Search"])
-def search_vendors(keywords: str):
+@app.get("/api/search/{keywords}", tags=["Search"], responses={200: {"model": VendorSearchResponse}})
+async def search_vendors(keywords: str):
     """Searches for stock symbols and names matching the given keywords."""
     try:
-        params = frozenset({"function": "SYMBOL_SEARCH", "keywords": keywords}.items())
-        raw_data = fetch_alpha_vantage_data(params)
-
-        # Filter for US markets and validate each result
-        us_results = [
-            SearchResult.model_validate(item) for item in raw_data.get("bestMatches", [])
-            if item.get("4. region") == "United States"
-        ]
-
-        # Return with snake_case field names
-        return {
-            "results": [
-                {
-                    "symbol": result.symbol,
-                    "name": result.name,
-                    "type": result.type,
-                    "region": result.region,
-                    "market_open": result.market_open,
-                    "market_close": result.market_close,
-                    "timezone": result.timezone,
-                    "currency": result.currency,
-                    "match_score": result.match_score
-                }
-                for result in us_results
-            ]
-        }
+        params = _key(function="SYMBOL_SEARCH", keywords=keywords)
+        raw_data = await fetch_alpha_vantage_data(params)
+
+        # Filter for US markets on the cheap string compare, stop once we have
+        # enough, and only then validate what is left
+        us_matches = islice(
+            (item for item in raw_data.get("bestMatches", []) if item.get("4. region") == SEARCH_REGION),
+            MAX_SEARCH_RESULTS,
+        )
+        us_results = SEARCH_RESULTS_ADAPTER.validate_python(list(us_matches))
+
+        # Dumps with snake_case field names
+        return {"results": SEARCH_RESULTS_ADAPTER.dump_python(us_results)}
     except (APIError, ValidationError) as e:
         status = e.status_code if isinstance(e, APIError) else 422
         detail = e.message if isinstance(e, APIError) else "Unexpected data format for search results."
@@ -850,4 +1484,19 @@ def search_vendors(keywords: str):
 # ==============================================================================
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info", reload=True)
\ No newline at end of file
+    if os.getenv("DEV"):
+        # File-watching auto-reload for local development (single worker)
+        uvicorn.run("main:app", host="127.0.0.1", port=8000, log_level="info", reload=True)
+    else:
+        # "auto" resolves to uvloop + httptools from requirements.txt, falling
+        # back to asyncio + h11 where they aren't available (e.g. Windows)
+        uvicorn.run(
+            "main:app",
+            host=os.getenv("HOST", "127.0.0.1"),
+            port=int(os.getenv("PORT", "8000")),
+            loop="auto",
+            http="auto",
+            workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2)),
+            log_level="info",
+            access_log=False,
+        )
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Tests for the single-flight request coalescing in main.py.
+
+Run from apps/api with: python -m unittest discover tests
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# main.py creates its SQLite cache in the working directory on import, so keep
+# it out of the checkout; the key only has to be set, it is never used here
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ALPHA_VANTAGE_API_KEY", "test")
+os.chdir(tempfile.mkdtemp())
+
+import main  # noqa: E402
+
+PARAMS = (("function", "OVERVIEW"), ("symbol", "CE"))
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_follower_does_not_affect_other_callers(self):
+        inflight = {}
+        release = asyncio.Event()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"Symbol": "CE"}
+
+        leader = asyncio.create_task(main._single_flight(inflight, PARAMS, load))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(main._single_flight(inflight, PARAMS, load)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        followers[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(leader, *followers, return_exceptions=True)
+        self.assertEqual(results[0], {"Symbol": "CE"})
+        self.assertIsInstance(results[1], asyncio.CancelledError)
+        self.assertEqual(results[2], {"Symbol": "CE"})
+        self.assertEqual(calls, 1)
+        self.assertEqual(inflight, {})
+
+    async def test_followers_share_the_leaders_exception(self):
+        inflight = {}
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            raise main.APIError("rate limit", 429)
+
+        tasks = [asyncio.create_task(main._single_flight(inflight, PARAMS, load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertTrue(all(isinstance(r, main.APIError) for r in results))
+        self.assertEqual(inflight, {})
+
+
+if __name__ == "__main__":
+    unittest.main()